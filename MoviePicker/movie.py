@@ -1,7 +1,10 @@
 import pandas as pd
 import requests
 import os
+import json
+import queue
 import random
+import threading
 import time
 from dotenv import load_dotenv
 
@@ -13,8 +16,17 @@ if not TMDB_API_KEY:
     print("❌ Error: TMDb API key not found. Make sure you have a .env file.")
     exit()
 
+SESSION_FILE = "movie_session.json"
+PREFETCH_AHEAD = 5  # how many cards the background fetcher may get ahead of voting
+REQUEST_TIMEOUT = 10  # seconds, so a quit never waits long on an in-flight lookup
+SESSION_KEYS = {"pool": list, "position": int, "yes_movies": list, "details": dict}
+DETAIL_KEYS = {"title", "overview", "rating", "release_date", "genres"}
+
 # --- HELPER FUNCTIONS ---
 
+class TMDbAPIError(Exception):
+    """Raised when TMDb rejects a request (e.g. a bad API key)."""
+
 def get_valid_input(prompt):
     """
     NEW: A function to ensure the user input is valid.
@@ -39,15 +51,18 @@ def get_genre_map():
         return None
 
 def get_movie_details(title, genre_map):
+    """
+    Returns (details, error). This runs on the fetcher thread, so instead of
+    printing a network problem it hands the message back for the game loop
+    to show when that card comes up.
+    """
     search_url = f"https://api.themoviedb.org/3/search/movie?api_key={TMDB_API_KEY}&query={title}"
     try:
-        response = requests.get(search_url)
+        response = requests.get(search_url, timeout=REQUEST_TIMEOUT)
         if response.status_code != 200:
             error_data = response.json()
             error_message = error_data.get('status_message', 'Unknown API error.')
-            print(f"❌ API Error: {error_message} (Status Code: {response.status_code})")
-            input("Press Enter to exit. Please check your API key in the .env file.")
-            exit()
+            raise TMDbAPIError(f"{error_message} (Status Code: {response.status_code})")
         
         data = response.json()
         if data['results']:
@@ -60,14 +75,87 @@ def get_movie_details(title, genre_map):
                 "rating": movie.get('vote_average', 0),
                 "release_date": movie.get('release_date', 'N/A'),
                 "genres": genres,
-            }
+            }, None
     except requests.RequestException as e:
-        print(f"❌ Network Error: Could not connect to TMDb. {e}")
-    return None
+        return None, f"❌ Network Error: Could not connect to TMDb. {e}"
+    return None, None
 
 def clear_screen():
     os.system('cls' if os.name == 'nt' else 'clear')
 
+def fetch_details_worker(titles, cached_details, genre_map, out_queue, stop_event):
+    """
+    Runs on a background thread so TMDb lookups overlap with voting.
+    Puts (title, details, error) on the queue in order; titles already in
+    the saved session are served from the cache instead of the network.
+    Any exception is passed through the queue for the main loop to report,
+    and the worker stops starting new lookups once stop_event is set.
+    """
+    for title in titles:
+        if stop_event.is_set():
+            return
+        if title in cached_details:
+            out_queue.put((title, cached_details[title], None))
+            continue
+        try:
+            details, error = get_movie_details(title, genre_map)
+        except Exception as e:
+            out_queue.put((title, None, e))
+            return
+        out_queue.put((title, details, error))
+
+def next_card(details_queue, fetcher):
+    """
+    Waits for the next fetched card. Returns None if the fetcher thread has
+    died without handing one over, rather than blocking forever.
+    """
+    while True:
+        try:
+            return details_queue.get(timeout=0.5)
+        except queue.Empty:
+            if not fetcher.is_alive() and details_queue.empty():
+                return None
+
+def is_valid_session(session):
+    if not isinstance(session, dict):
+        return False
+    for key, expected_type in SESSION_KEYS.items():
+        if not isinstance(session.get(key), expected_type):
+            return False
+    if not all(isinstance(title, str) for title in session['pool']):
+        return False
+    if not 0 <= session['position'] <= len(session['pool']):
+        return False
+    movies = session['yes_movies'] + list(session['details'].values())
+    return all(isinstance(movie, dict) and DETAIL_KEYS <= movie.keys() for movie in movies)
+
+def load_session(candidate_pool):
+    """
+    Returns the saved session if it was built from the same movie pool,
+    otherwise None (the CSVs have changed, so the old order is stale).
+    """
+    try:
+        with open(SESSION_FILE) as f:
+            session = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if not is_valid_session(session):
+        return None
+    if sorted(session['pool']) != sorted(candidate_pool):
+        return None
+    return session
+
+def save_session(session):
+    # Write to a temp file first so a crash mid-write can't corrupt the save.
+    temp_file = SESSION_FILE + ".tmp"
+    with open(temp_file, "w") as f:
+        json.dump(session, f)
+    os.replace(temp_file, SESSION_FILE)
+
+def clear_session():
+    if os.path.exists(SESSION_FILE):
+        os.remove(SESSION_FILE)
+
 # --- MAIN LOGIC ---
 
 genre_lookup = get_genre_map()
@@ -103,19 +191,67 @@ if not final_candidate_pool:
 
 # --- THE INTERACTIVE GAME ---
 print(f"✅ Movie pool successfully built! Total options: {len(final_candidate_pool)}")
+
+session = load_session(final_candidate_pool)
+if session and session['position'] < len(session['pool']):
+    print(f"💾 Found a saved session ({session['position']}/{len(session['pool'])} movies voted on).")
+    if input("Resume it? (y/n): ").lower().strip() != 'y':
+        session = None
+else:
+    session = None
+
+if session is None:
+    random.shuffle(final_candidate_pool)
+    session = {"pool": final_candidate_pool, "position": 0, "yes_movies": [], "details": {}}
+
 input("\nPress Enter to start the game...")
 
-random.shuffle(final_candidate_pool)
-yes_movies = []
+yes_movies = session['yes_movies']
+details_cache = session['details']
 game_quit = False
+last_match = None
+
+# Producer/consumer: the fetcher thread fills the queue while we vote.
+details_queue = queue.Queue(maxsize=PREFETCH_AHEAD)
+stop_fetching = threading.Event()
+fetcher = threading.Thread(
+    target=fetch_details_worker,
+    args=(session['pool'][session['position']:], dict(details_cache), genre_lookup, details_queue, stop_fetching),
+    daemon=True,
+)
+fetcher.start()
+
+while session['position'] < len(session['pool']):
+    card = next_card(details_queue, fetcher)
+    if card is None:
+        card = (None, None, RuntimeError("The background fetcher stopped unexpectedly."))
+    movie_title, details, error = card
+
+    if isinstance(error, Exception):
+        clear_screen()
+        save_session(session)
+        if isinstance(error, TMDbAPIError):
+            print(f"❌ API Error: {error}")
+            input("Press Enter to exit. Please check your API key in the .env file.")
+        else:
+            print(f"❌ Unexpected error while fetching movie details: {error!r}")
+            input("Press Enter to exit. Your progress has been saved.")
+        exit()
+    if details:
+        details_cache[movie_title] = details
 
-for movie_title in final_candidate_pool:
     clear_screen()
-    details = get_movie_details(movie_title, genre_lookup)
-    
+    if last_match:
+        print(f"✅ Match! '{last_match}' added to the final showdown.\n")
+        last_match = None
+
     if not details:
+        if error:
+            print(error)
         print(f"Could not fetch details for {movie_title}. Skipping.")
         input("Press Enter to continue...")
+        session['position'] += 1
+        save_session(session)
         continue
 
     print("--------------------------------------------------")
@@ -138,14 +274,31 @@ for movie_title in final_candidate_pool:
 
     if your_vote == 'y' and partner_vote == 'y':
         yes_movies.append(details)
-        print(f"\n✅ Match! '{details['title']}' added to the final showdown.")
-        time.sleep(2)
+        last_match = details['title']
+
+    session['position'] += 1
+    save_session(session)
+
+if game_quit:
+    # Let the fetcher finish its in-flight lookup, keeping everything it hands
+    # over, so a resume doesn't re-fetch it. Draining also unblocks its put().
+    stop_fetching.set()
+    while fetcher.is_alive() or not details_queue.empty():
+        try:
+            movie_title, details, error = details_queue.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        if details:
+            details_cache[movie_title] = details
+    save_session(session)
+else:
+    clear_session()
 
 # --- THE FINAL SHOWDOWN ---
 clear_screen()
 
 if game_quit:
-    print("👋 Game quit. See you next time!")
+    print("👋 Game quit. Your progress is saved - run again to pick up where you left off!")
 elif not yes_movies:
     print("😢 Looks like you didn't agree on any movies tonight.")
 elif len(yes_movies) == 1: